@@ -0,0 +1,14 @@
+"""
+Benchmark de carga do backend FastAPI.
+
+    cd backend/fastapi
+    python -m bench.run --rows 200000 --scenario login_burst,dashboard_poll
+
+Sobe um stand-in do Nest (bench.nest_stub) com latência/erros configuráveis,
+gera um SQLite com N logins (bench.seed), inicia `uvicorn main:app` num
+subprocesso apontando para ambos e mede p50/p95/p99 e req/s de cada cenário.
+
+    python -m bench.hot_index --rows 100000,500000
+
+Tempo de carga e memória do índice em memória de /clients/connected por tamanho.
+"""
@@ -0,0 +1,103 @@
+"""
+Tempo de carga e memória do índice em memória de /clients/connected (main._HotIndex)
+para os tamanhos de dataset do benchmark, comparando a consulta de página com o SQLite.
+
+    python -m bench.hot_index --rows 100000,200000,500000
+
+Para cada tamanho: gera o SQLite (bench.seed), carrega o índice como no startup,
+mede a memória retida (tracemalloc, numa segunda carga) e a latência de uma página
+de /clients/connected pelo índice e por STORAGE.query_connected.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from bench.run import percentile
+from bench.seed import SSIDS, seed
+
+
+def load_index(main):
+    last_id, rows = main._db_hot_snapshot()
+    index = main._HotIndex()
+    index.load(last_id, rows)
+    return index
+
+
+def measure(main, rows: int, workdir: str, queries: int) -> Dict[str, Any]:
+    db_path = os.path.join(workdir, f"clients-{rows}.db")
+    # Conexão de escrita do tamanho anterior aponta para outro arquivo
+    main._db_close_writer()
+    seed_secs = seed(db_path, rows)
+
+    t0 = time.perf_counter()
+    index = load_index(main)
+    load_ms = (time.perf_counter() - t0) * 1000.0
+    stats = index.stats()
+    del index
+    gc.collect()
+
+    tracemalloc.start()
+    index = load_index(main)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=main.RETENTION_DAYS)).isoformat()
+    columns = main._connected_columns(None, False)
+
+    def timed(fn) -> List[float]:
+        out = []
+        for i in range(queries):
+            ssid = None if i % 2 else SSIDS[i % len(SSIDS)]
+            t = time.perf_counter()
+            fn(ssid)
+            out.append((time.perf_counter() - t) * 1000.0)
+        out.sort()
+        return out
+
+    hot = timed(lambda ssid: index.page(cutoff, ssid, None, None, main.CLIENTS_PAGE_SIZE, columns))
+    sql = timed(lambda ssid: asyncio.run(main.STORAGE.query_connected(cutoff, ssid, None, main.CLIENTS_PAGE_SIZE, columns)))
+    return {
+        "rows": rows,
+        "sessions": stats["sessions"],
+        "seedSecs": round(seed_secs, 1),
+        "loadMs": round(load_ms, 1),
+        "retainedMB": round(retained / 2**20, 1),
+        "peakMB": round(peak / 2**20, 1),
+        "bytesPerSession": int(retained / max(1, stats["sessions"])),
+        "hotPageP50Ms": round(percentile(hot, 50), 3),
+        "sqlPageP50Ms": round(percentile(sql, 50), 3),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--rows", default="100000,200000", help="tamanhos separados por vírgula")
+    ap.add_argument("--queries", type=int, default=200, help="páginas medidas por tamanho")
+    ap.add_argument("--json", default=None, help="grava os resultados neste arquivo")
+    args = ap.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="portal-hot-")
+    os.environ["LOG_DIR"] = workdir
+    os.environ.setdefault("CLIENTS_DB_PATH", os.path.join(workdir, "clients.db"))
+    import main as app_main  # lê CLIENTS_DB_PATH/LOG_DIR na importação
+
+    results = [measure(app_main, int(n), workdir, args.queries) for n in args.rows.split(",") if n.strip()]
+    cols = ["rows", "sessions", "loadMs", "retainedMB", "peakMB", "bytesPerSession", "hotPageP50Ms", "sqlPageP50Ms"]
+    print("".join(f"{c:>16}" for c in cols))
+    for res in results:
+        print("".join(f"{res[c]:>16}" for c in cols))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Stand-in do Nest com os endpoints usados por main.py, latência e erros injetáveis.
+
+Pode rodar dentro do processo do benchmark (start_in_thread) ou sozinho:
+
+    python -m bench.nest_stub --port 4102 --latency-ms 20 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 10.0
+    jitter_ms: float = 5.0
+    error_rate: float = 0.0
+    # Latência específica por upstream (persist, portal_config, authorize, clients, aps)
+    overrides: Dict[str, float] = field(default_factory=dict)
+    site_id: str = "default"
+    stations: int = 500
+    aps: int = 20
+
+
+def ap_mac(i: int) -> str:
+    return f"0a:00:00:00:{(i >> 8) & 0xFF:02x}:{i & 0xFF:02x}"
+
+
+def client_mac(i: int) -> str:
+    return f"02:00:{(i >> 24) & 0xFF:02x}:{(i >> 16) & 0xFF:02x}:{(i >> 8) & 0xFF:02x}:{i & 0xFF:02x}"
+
+
+def create_app(cfg: StubConfig) -> FastAPI:
+    app = FastAPI(title="Nest stub")
+    app.state.calls = Counter()
+    app.state.cfg = cfg
+
+    async def upstream(name: str) -> Optional[JSONResponse]:
+        """Registra a chamada, aplica a latência e, conforme error_rate, devolve um erro."""
+        app.state.calls[name] += 1
+        base = cfg.overrides.get(name, cfg.latency_ms)
+        delay = max(0.0, base + random.uniform(-cfg.jitter_ms, cfg.jitter_ms)) / 1000.0
+        if delay:
+            await asyncio.sleep(delay)
+        if cfg.error_rate and random.random() < cfg.error_rate:
+            app.state.calls[f"{name}_error"] += 1
+            return JSONResponse({"error": "injected failure"}, status_code=503)
+        return None
+
+    @app.post("/connections")
+    async def connections(request: Request):
+        await request.body()
+        return await upstream("persist") or {"connection": {"id": app.state.calls["persist"]}}
+
+    @app.post("/connections/batch")
+    async def connections_batch(request: Request):
+        body = await request.json()
+        items: List[Any] = body.get("connections") or []
+        err = await upstream("persist_batch")
+        if err:
+            return err
+        return {"results": [{"ok": True, "id": i} for i, _ in enumerate(items)]}
+
+    @app.get("/controllers")
+    async def controllers():
+        return {"controllers": [{"id": 1, "name": "stub"}]}
+
+    @app.get("/controllers/{ctrl_id}/portal-config")
+    async def portal_config(ctrl_id: int):
+        return await upstream("portal_config") or {"config": {"siteId": cfg.site_id}}
+
+    @app.post("/controllers/{ctrl_id}/authorize")
+    async def authorize(ctrl_id: int, request: Request):
+        body = await request.json()
+        return await upstream("authorize") or {"ok": True, "mac": body.get("mac")}
+
+    @app.get("/controllers/{ctrl_id}/clients")
+    async def clients(ctrl_id: int, siteId: Optional[str] = None):
+        err = await upstream("clients")
+        if err:
+            return err
+        return {
+            "clients": [
+                {
+                    "mac": client_mac(i),
+                    "ip": f"10.{(i >> 16) & 0xFF}.{(i >> 8) & 0xFF}.{i & 0xFF}",
+                    "apMac": ap_mac(i % max(1, cfg.aps)),
+                    "rxBytes": i * 1000,
+                    "txBytes": i * 500,
+                }
+                for i in range(cfg.stations)
+            ]
+        }
+
+    @app.get("/controllers/{ctrl_id}/aps")
+    async def aps(ctrl_id: int, siteId: Optional[str] = None):
+        err = await upstream("aps")
+        if err:
+            return err
+        return {"devices": [{"mac": ap_mac(i), "name": f"AP {i:03d}"} for i in range(cfg.aps)]}
+
+    @app.get("/stub/calls")
+    async def calls():
+        return dict(app.state.calls)
+
+    return app
+
+
+def start_in_thread(cfg: StubConfig, port: int):
+    """Sobe o stub num thread do processo atual; retorna (server, app)."""
+    import uvicorn
+
+    app = create_app(cfg)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Nest stub não iniciou")
+        time.sleep(0.05)
+    return server, app
+
+
+def main():
+    import uvicorn
+
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--port", type=int, default=4102)
+    ap.add_argument("--latency-ms", type=float, default=10.0)
+    ap.add_argument("--jitter-ms", type=float, default=5.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--stations", type=int, default=500)
+    ap.add_argument("--aps", type=int, default=20)
+    args = ap.parse_args()
+    cfg = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        stations=args.stations,
+        aps=args.aps,
+    )
+    uvicorn.run(create_app(cfg), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
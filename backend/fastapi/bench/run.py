@@ -0,0 +1,244 @@
+"""
+Executa os cenários de carga contra `uvicorn main:app` com o Nest stub.
+
+    python -m bench.run --rows 200000 --scenario login_burst,dashboard_poll \
+        --requests 2000 --concurrency 100 --latency-ms 20 --error-rate 0.01
+
+Cenários:
+  login_burst     POST /auth/login com MACs novos (ônibus chegando no AP)
+  dashboard_poll  GET /clients/connected com enriquecimento da controladora
+  stats_poll      GET /clients/stats (contadores do dashboard)
+
+Para cada um: requisições, erros, req/s e latência p50/p95/p99/max em ms.
+Ao final, o estado do índice em memória (/health: sessões e tempo de carga);
+memória por tamanho de dataset em `python -m bench.hot_index`.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import httpx
+
+from bench.nest_stub import StubConfig, client_mac, start_in_thread
+from bench.seed import USER_AGENTS, seed
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(pct / 100.0 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[k]
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    make_request: Callable[[httpx.AsyncClient, int], Any],
+    total: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Dispara `total` requisições com no máximo `concurrency` simultâneas."""
+    latencies: List[float] = []
+    errors = 0
+    ids = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in ids:
+            t0 = time.perf_counter()
+            try:
+                r = await make_request(client, i)
+                if r.status_code >= 400:
+                    errors += 1
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - t0) * 1000.0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1) if elapsed else 0.0,
+        "p50": round(percentile(latencies, 50), 2),
+        "p95": round(percentile(latencies, 95), 2),
+        "p99": round(percentile(latencies, 99), 2),
+        "max": round(latencies[-1], 2) if latencies else 0.0,
+    }
+
+
+def login_burst(offset: int):
+    async def req(client: httpx.AsyncClient, i: int):
+        n = offset + i
+        return await client.post(
+            "/auth/login",
+            json={
+                "name": f"Bench {n}",
+                "email": f"bench{n}@mail.com",
+                "acceptTerms": True,
+                "controllerId": 1,
+                "clientMac": client_mac(n),
+                "ssid": "WIFI FREE",
+            },
+            headers={"user-agent": USER_AGENTS[n % len(USER_AGENTS)]},
+        )
+    return req
+
+
+def dashboard_poll(site_id: str):
+    async def req(client: httpx.AsyncClient, i: int):
+        return await client.get(
+            "/clients/connected",
+            params={"ssid": "WIFI FREE", "controllerId": 1, "siteId": site_id},
+        )
+    return req
+
+
+def stats_poll():
+    async def req(client: httpx.AsyncClient, i: int):
+        return await client.get("/clients/stats")
+    return req
+
+
+def start_app(port: int, env: Dict[str, str], workers: int, log_path: str) -> subprocess.Popen:
+    cmd = [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ]
+    # Saída do servidor vai para arquivo: não disputa o terminal com o relatório
+    log = open(log_path, "ab")
+    proc = subprocess.Popen(cmd, cwd=APP_DIR, env={**os.environ, **env}, stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"main:app encerrou no startup (código {proc.returncode})")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("main:app não respondeu a /health")
+
+
+def print_report(results: Dict[str, Dict[str, Any]]):
+    cols = ["requests", "errors", "rps", "p50", "p95", "p99", "max"]
+    print(f"{'scenario':<16}" + "".join(f"{c:>10}" for c in cols) + "   (latência em ms)")
+    for name, res in results.items():
+        print(f"{name:<16}" + "".join(f"{res[c]:>10}" for c in cols))
+
+
+async def run_scenarios(args, port: int, site_id: str) -> Dict[str, Dict[str, Any]]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    results: Dict[str, Dict[str, Any]] = {}
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30) as client:
+        for name in args.scenario.split(","):
+            name = name.strip()
+            if name == "login_burst":
+                make = login_burst(args.rows)
+            elif name == "dashboard_poll":
+                make = dashboard_poll(site_id)
+            elif name == "stats_poll":
+                make = stats_poll()
+            else:
+                raise SystemExit(f"cenário desconhecido: {name}")
+            if args.warmup:
+                await run_load(client, make, args.warmup, min(args.concurrency, args.warmup))
+            results[name] = await run_load(client, make, args.requests, args.concurrency)
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scenario", default="login_burst,dashboard_poll,stats_poll")
+    ap.add_argument("--rows", type=int, default=100_000, help="logins pré-existentes no SQLite")
+    ap.add_argument("--requests", type=int, default=1000, help="requisições por cenário")
+    ap.add_argument("--concurrency", type=int, default=50)
+    ap.add_argument("--warmup", type=int, default=50, help="requisições descartadas antes de medir")
+    ap.add_argument("--workers", type=int, default=1, help="workers do uvicorn")
+    ap.add_argument("--latency-ms", type=float, default=10.0, help="latência base do Nest stub")
+    ap.add_argument("--jitter-ms", type=float, default=5.0)
+    ap.add_argument("--authorize-latency-ms", type=float, default=None)
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fração de respostas 503 do stub")
+    ap.add_argument("--stations", type=int, default=500, help="clientes retornados por /controllers/:id/clients")
+    ap.add_argument("--aps", type=int, default=20)
+    ap.add_argument("--db", default=None, help="reutiliza um SQLite já gerado (pula o seed)")
+    ap.add_argument("--redis-host", default="", help="REDIS_HOST para o servidor (padrão: sem Redis)")
+    ap.add_argument("--json", default=None, help="grava os resultados neste arquivo")
+    args = ap.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="portal-bench-")
+    db_path = args.db or os.path.join(workdir, "clients.db")
+    os.environ["LOG_DIR"] = workdir
+    if not args.db:
+        secs = seed(db_path, args.rows, aps=args.aps)
+        print(f"seed: {args.rows} logins em {secs:.1f}s ({db_path})")
+
+    overrides = {}
+    if args.authorize_latency_ms is not None:
+        overrides["authorize"] = args.authorize_latency_ms
+    stub_cfg = StubConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        overrides=overrides,
+        stations=args.stations,
+        aps=args.aps,
+    )
+    stub_port = free_port()
+    stub_server, stub_app = start_in_thread(stub_cfg, stub_port)
+
+    port = free_port()
+    env = {
+        "CLIENTS_DB_PATH": db_path,
+        "LOG_DIR": workdir,
+        "NEST_HOST": "127.0.0.1",
+        "NEST_PORT": str(stub_port),
+        "REDIS_HOST": args.redis_host,
+    }
+    proc = start_app(port, env, args.workers, os.path.join(workdir, "server.log"))
+    hot_index = None
+    try:
+        results = asyncio.run(run_scenarios(args, port, stub_cfg.site_id))
+        try:
+            hot_index = httpx.get(f"http://127.0.0.1:{port}/health", timeout=5).json().get("hotIndex")
+        except httpx.HTTPError:
+            pass
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+        stub_server.should_exit = True
+
+    print_report(results)
+    print(f"log do servidor: {os.path.join(workdir, 'server.log')}")
+    print("chamadas ao Nest stub:", dict(stub_app.state.calls))
+    print("índice em memória:", hot_index)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {"args": vars(args), "results": results, "nestCalls": dict(stub_app.state.calls), "hotIndex": hot_index},
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Gera um client_logins sintético para o benchmark, usando o esquema e a rotina
+de gravação em lote de main.py (mesmas colunas derivadas e agregados).
+
+    python -m bench.seed --db /tmp/bench.db --rows 200000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from bench.nest_stub import ap_mac, client_mac
+
+SSIDS = ["WIFI FREE", "EVENTO", "VISITANTES"]
+USER_AGENTS = [
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X)",
+    "Mozilla/5.0 (Linux; Android 14; SM-S918B)",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0)",
+    "Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X)",
+]
+
+
+def seed(
+    db_path: str,
+    rows: int,
+    days: int = 15,
+    devices: int = 0,
+    aps: int = 20,
+    test_ratio: float = 0.05,
+    batch: int = 5000,
+) -> float:
+    """Cria `rows` logins espalhados nos últimos `days` dias; retorna a duração em segundos."""
+    os.environ["CLIENTS_DB_PATH"] = db_path
+    import main  # lê CLIENTS_DB_PATH na importação
+
+    main.DB_PATH = db_path
+    main._db_init()
+    rnd = random.Random(42)
+    devices = devices or max(1, rows // 3)
+    now = datetime.now(timezone.utc)
+    span = days * 86400
+    t0 = time.perf_counter()
+    buf = []
+    for i in range(rows):
+        dev = rnd.randrange(devices)
+        is_test = rnd.random() < test_ratio
+        email = f"teste{i}@example.com" if is_test else f"guest{dev}@mail.com"
+        ua = USER_AGENTS[dev % len(USER_AGENTS)]
+        created = (now - timedelta(seconds=rnd.uniform(0, span))).isoformat()
+        buf.append(
+            (
+                f"Guest {dev}",
+                email,
+                None,
+                SSIDS[dev % len(SSIDS)],
+                client_mac(dev),
+                ap_mac(rnd.randrange(max(1, aps))),
+                f"10.0.{(dev >> 8) & 0xFF}.{dev & 0xFF}",
+                ua,
+                created,
+                main._parse_device_from_ua(ua),
+                1 if main._is_test_user(None, email, None) else 0,
+            )
+        )
+        if len(buf) >= batch:
+            main._db_insert_logins(buf)
+            buf = []
+    main._db_insert_logins(buf)
+    # Evita backfill/reclassificação no startup do servidor: os dados já saem classificados
+    main._db_meta_set("classifier_version", main.CLASSIFIER_VERSION)
+    main._db_meta_set("stats_built", now.isoformat())
+    main._db_meta_set("sessions_built", now.isoformat())
+    return time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--db", required=True)
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--days", type=int, default=15)
+    ap.add_argument("--devices", type=int, default=0, help="MACs distintos (padrão: rows/3)")
+    ap.add_argument("--aps", type=int, default=20)
+    args = ap.parse_args()
+    secs = seed(args.db, args.rows, args.days, args.devices, args.aps)
+    print(f"{args.rows} logins gerados em {secs:.1f}s -> {args.db}")
+
+
+if __name__ == "__main__":
+    main()
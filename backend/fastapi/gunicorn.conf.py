@@ -0,0 +1,49 @@
+"""
+Modo multi-worker: gunicorn gerenciando workers uvicorn.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+WEB_CONCURRENCY define o número de workers. Sem ele: um por CPU disponível
+quando há Redis (cache, invalidação e single-flight compartilhados) e apenas
+um sem Redis, já que o cache em memória seria separado por worker.
+"""
+import os
+import shutil
+
+
+def _default_workers() -> int:
+    if not os.getenv("REDIS_HOST"):
+        return 1
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+bind = f"0.0.0.0:{os.getenv('FASTAPI_PORT', '4001')}"
+workers = int(os.getenv("WEB_CONCURRENCY") or _default_workers())
+# Herdado pelos workers: com mais de um, cada um grava fastapi.<pid>.log (ver main.py)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "uvicorn.workers.UvicornWorker"
+# O shutdown de cada worker drena a fila de logins antes de sair
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+
+def on_starting(server):
+    # Métricas multiprocess: arquivos da execução anterior não podem ser somados
+    path = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        try:
+            from prometheus_client import multiprocess
+
+            multiprocess.mark_process_dead(worker.pid)
+        except Exception:
+            pass
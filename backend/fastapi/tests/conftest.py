@@ -0,0 +1,32 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Banco, logs e spill num diretório temporário antes de importar o app
+_TMP = tempfile.mkdtemp(prefix="portal-tests-")
+os.environ.setdefault("CLIENTS_DB_PATH", os.path.join(_TMP, "clients.db"))
+os.environ.setdefault("LOG_DIR", _TMP)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ["STORAGE_BACKEND"] = "sqlite"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def app_main():
+    """Módulo do app com banco vazio, sem Redis e sem índice em memória publicado."""
+    main._redis_client = None
+    main._db_init()
+    with main._writer_lock:
+        conn = main._db_writer()
+        with conn:
+            conn.execute("DELETE FROM client_logins")
+            conn.execute("DELETE FROM client_sessions")
+    main.GENERATIONS.clear()
+    main._HOT = None
+    main._hot_reload_task = None
+    yield main
+    main._HOT = None
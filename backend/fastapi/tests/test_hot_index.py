@@ -0,0 +1,95 @@
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+
+def _login(mac, minutes_ago=1, ssid="WIFI"):
+    created = (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).isoformat()
+    return ("Ana", "ana@x.com", None, ssid, mac, "ap", "10.0.0.1", "ua", created, "Android", 0)
+
+
+def _cutoff(main):
+    return (datetime.now(timezone.utc) - timedelta(days=main.RETENTION_DAYS)).isoformat()
+
+
+def _listed(main, index):
+    rows, _ = index.page(_cutoff(main), None, None, None, 100, ["id", "created_at", "client_mac"])
+    return sorted(r["client_mac"] for r in rows)
+
+
+def test_append_after_gap_catches_up(app_main):
+    main = app_main
+
+    async def run():
+        main._HOT = await main._hot_index_load()
+        # Lote que não chegou ao índice: last_id fica um atrás
+        main._db_insert_logins([_login("aa:00:00:00:00:01")])
+        for i in range(2, 6):
+            rows = [_login(f"aa:00:00:00:00:0{i}")]
+            ids = main._db_insert_logins(rows)
+            await main._hot_index_append(rows, ids)
+        return main._HOT, ids[-1]
+
+    index, last_id = asyncio.run(run())
+    assert _listed(main, index) == [f"aa:00:00:00:00:0{i}" for i in range(1, 6)]
+    assert index.last_id == last_id
+
+
+def test_append_retries_on_swapped_index(app_main):
+    main = app_main
+
+    async def run():
+        old = main._HOT = await main._hot_index_load()
+        # Snapshot anterior ao lote, como numa recarga que terminou durante a gravação
+        new = await main._hot_index_load()
+        rows = [_login("aa:00:00:00:00:01")]
+        ids = main._db_insert_logins(rows)
+        await old.lock.acquire()
+        task = asyncio.create_task(main._hot_index_append(rows, ids))
+        await asyncio.sleep(0)
+        main._HOT = new
+        old.lock.release()
+        await task
+        return old, new
+
+    old, new = asyncio.run(run())
+    assert _listed(main, new) == ["aa:00:00:00:00:01"]
+    assert _listed(main, old) == []
+
+
+def test_generation_bump_reloads_in_background(app_main):
+    main = app_main
+
+    async def run():
+        main._HOT = await main._hot_index_load()
+        first = main._HOT
+        main._clients_cache_bump_all()
+        # Até a troca, a consulta vai ao banco
+        assert await main._hot_index_sync() is None
+        rows = [_login("aa:00:00:00:00:02")]
+        await main._hot_index_append(rows, main._db_insert_logins(rows))
+        await main._hot_reload_task
+        assert main._HOT is not first
+        return await main._hot_index_sync()
+
+    index = asyncio.run(run())
+    assert index is not None
+    assert _listed(main, index) == ["aa:00:00:00:00:02"]
+
+
+def test_sync_reads_other_worker_commits(app_main):
+    main = app_main
+
+    async def run():
+        main._HOT = await main._hot_index_load()
+        other = sqlite3.connect(main.DB_PATH)
+        saved, main._writer_conn = main._writer_conn, other
+        try:
+            main._db_insert_logins([_login("aa:00:00:00:00:03")])
+        finally:
+            main._writer_conn = saved
+            other.close()
+        return await main._hot_index_sync()
+
+    index = asyncio.run(run())
+    assert _listed(main, index) == ["aa:00:00:00:00:03"]
@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def admission(app_main, monkeypatch):
+    main = app_main
+    main._login_buckets.clear()
+    main._AUTHORIZE_BREAKERS.clear()
+    main._login_waiting = 0
+    monkeypatch.setattr(main, "_login_slots", None)
+    return main
+
+
+def _payload(main, **kw):
+    return main.LoginPayload(name="Ana", email="ana@x.com", acceptTerms=True, **kw)
+
+
+def _half_open(main, ctrl_id=1):
+    main._AUTHORIZE_BREAKERS[ctrl_id] = {"state": "open", "failures": 5, "openUntil": time.time() - 1, "probe": None}
+    return main._AUTHORIZE_BREAKERS[ctrl_id]
+
+
+def test_cancelled_probe_frees_half_open_slot(admission, monkeypatch):
+    main = admission
+    monkeypatch.setattr(main, "LOGIN_MAX_INFLIGHT", 1)
+    monkeypatch.setattr(main, "LOGIN_ADMISSION_WAIT", 5.0)
+    breaker = _half_open(main)
+
+    async def run():
+        main._login_slots = asyncio.Semaphore(1)
+        await main._login_slots.acquire()
+        # Sonda esperando vaga; o cliente desconecta
+        task = asyncio.create_task(main._login_admit(_payload(main, clientMac="aa:bb:cc:dd:ee:01"), "10.0.0.1"))
+        await asyncio.sleep(0.05)
+        assert breaker["probe"] is not None
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker["probe"] is None
+    assert main._login_waiting == 0
+
+
+def test_timed_out_probe_frees_half_open_slot(admission, monkeypatch):
+    main = admission
+    monkeypatch.setattr(main, "LOGIN_ADMISSION_WAIT", 0.01)
+    breaker = _half_open(main)
+
+    async def run():
+        main._login_slots = asyncio.Semaphore(1)
+        await main._login_slots.acquire()
+        with pytest.raises(HTTPException) as exc:
+            await main._login_admit(_payload(main, clientMac="aa:bb:cc:dd:ee:02"), "10.0.0.1")
+        return exc.value
+
+    exc = asyncio.run(run())
+    assert exc.status_code == 503
+    assert breaker["probe"] is None
+
+
+def test_released_ticket_frees_probe(admission):
+    main = admission
+    breaker = _half_open(main)
+
+    async def run():
+        ticket = await main._login_admit(_payload(main, clientMac="aa:bb:cc:dd:ee:03"), "10.0.0.1")
+        assert breaker["probe"] is ticket.probe is not None
+        ticket.release()
+
+    asyncio.run(run())
+    assert breaker["probe"] is None
+
+
+def test_mac_less_bucket_ignores_client_supplied_site(admission, monkeypatch):
+    main = admission
+    monkeypatch.setattr(main, "LOGIN_RATE_IP_BURST", 2)
+
+    async def run():
+        statuses = []
+        for site in ("a", "b", "c"):
+            try:
+                ticket = await main._login_admit(_payload(main, siteId=site, ssid=site), "10.0.0.9")
+                ticket.release()
+                statuses.append(200)
+            except HTTPException as e:
+                statuses.append(e.status_code)
+        return statuses
+
+    assert asyncio.run(run()) == [200, 200, 429]
+
+
+def test_redis_failure_falls_back_to_local_bucket(admission, monkeypatch):
+    main = admission
+
+    class Down:
+        def eval(self, *args):
+            raise TimeoutError("redis timeout")
+
+    monkeypatch.setattr(main, "_redis_client", Down())
+
+    async def run():
+        return [await main._login_rate_wait("aa:bb:cc:dd:ee:04") for _ in range(main.LOGIN_RATE_BURST + 1)]
+
+    waits = asyncio.run(run())
+    assert waits[:-1] == [0.0] * main.LOGIN_RATE_BURST
+    assert waits[-1] > 0
@@ -0,0 +1,62 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+
+def _login(name):
+    return (name, f"{name}@x.com", None, "WIFI", None, "ap", "10.0.0.1", "ua",
+            datetime.now(timezone.utc).isoformat(), "Android", 0)
+
+
+@pytest.fixture
+def queue_main(app_main, monkeypatch):
+    main = app_main
+    if os.path.exists(main.LOGIN_SPILL_PATH):
+        os.remove(main.LOGIN_SPILL_PATH)
+    monkeypatch.setattr(main, "LOGIN_SPILL_RETRY_INTERVAL", 0.05)
+    monkeypatch.setattr(main, "LOGIN_FLUSH_INTERVAL", 0.01)
+    yield main
+    main._login_queue = None
+    main._login_writer_task = None
+    if os.path.exists(main.LOGIN_SPILL_PATH):
+        os.remove(main.LOGIN_SPILL_PATH)
+
+
+def test_full_queue_spills_without_touching_the_database(queue_main, monkeypatch):
+    main = queue_main
+
+    async def broken(rows):
+        raise AssertionError("o request não pode gravar no banco")
+
+    async def run():
+        main._login_queue = asyncio.Queue(maxsize=1)
+        main._login_queue.put_nowait(_login("na_fila"))
+        main._login_writer_task = asyncio.get_running_loop().create_future()
+        monkeypatch.setattr(main.STORAGE, "insert_logins", broken)
+        await main._enqueue_login(_login("excedente"))
+        main._login_writer_task.set_result(None)
+
+    asyncio.run(run())
+    assert main._spill_pending()
+
+
+def test_idle_writer_replays_spilled_logins(queue_main):
+    main = queue_main
+
+    async def run():
+        await main._spill_rows([_login("ana"), _login("bia")])
+        queue = asyncio.Queue()
+        task = asyncio.create_task(main._login_writer_loop(queue))
+        for _ in range(100):
+            if not main._spill_pending():
+                break
+            await asyncio.sleep(0.02)
+        await queue.put(None)
+        await task
+
+    asyncio.run(run())
+    assert not main._spill_pending()
+    names = [r["name"] for r in asyncio.run(main.STORAGE.query_since("", None, 0, None, 10, ["id", "name", "created_at"]))[0]]
+    assert names == ["ana", "bia"]
@@ -0,0 +1,93 @@
+import asyncio
+import sqlite3
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def outbox(app_main, monkeypatch):
+    main = app_main
+    main._outbox_init()
+    with main._writer_lock:
+        conn = main._db_writer()
+        with conn:
+            conn.execute("DELETE FROM nest_outbox")
+    main._outbox_breaker.update({"state": "closed", "failures": 0, "openUntil": 0.0})
+    # Sem espera entre tentativas: o item volta a vencer na hora
+    monkeypatch.setattr(main, "_outbox_backoff", lambda attempts: 0.0)
+    return main
+
+
+def _rows(main):
+    conn = sqlite3.connect(main.DB_PATH)
+    try:
+        return conn.execute("SELECT status, attempts FROM nest_outbox ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def _dispatch(main):
+    async def run():
+        main._outbox_event = asyncio.Event()
+        await main._outbox_dispatch_once()
+
+    asyncio.run(run())
+
+
+def test_timed_out_batch_is_redelivered_with_same_token(outbox, monkeypatch):
+    main = outbox
+    main._outbox_add({"name": "Ana", "email": "ana@x.com", "acceptTerms": True, "token": "session_1"})
+    sent_tokens = []
+
+    async def nest(upstream, method, path, json=None, **kw):
+        sent_tokens.extend(r["token"] for r in json["connections"])
+        if len(sent_tokens) == 1:
+            # Nest gravou, mas a resposta não chegou
+            raise httpx.ReadTimeout("timeout")
+        return True, {"results": [{"ok": True, "id": 1}]}
+
+    monkeypatch.setattr(main, "_nest_request", nest)
+    _dispatch(main)
+    assert _rows(main) == [("pending", 1)]
+    _dispatch(main)
+    assert sent_tokens == ["session_1", "session_1"]
+    assert _rows(main) == []
+    assert main._outbox_breaker["state"] == "closed"
+
+
+def test_rejected_item_is_not_retried(outbox, monkeypatch):
+    main = outbox
+    main._outbox_add({"name": "Ana", "acceptTerms": True, "token": "session_2"})
+    main._outbox_add({"name": "Bia", "email": "bia@x.com", "acceptTerms": True, "token": "session_3"})
+
+    async def nest(upstream, method, path, json=None, **kw):
+        return True, {"results": [{"ok": False, "error": "Provide email or phone"}, {"ok": True, "id": 2}]}
+
+    monkeypatch.setattr(main, "_nest_request", nest)
+    _dispatch(main)
+    assert _rows(main) == [("dead", 0)]
+
+
+def test_breaker_opens_after_failures_and_probes_one_item(outbox, monkeypatch):
+    main = outbox
+    monkeypatch.setattr(main, "OUTBOX_BREAKER_THRESHOLD", 2)
+    for i in range(3):
+        main._outbox_add({"name": f"n{i}", "email": "x@x.com", "acceptTerms": True, "token": f"session_b{i}"})
+    batches = []
+
+    async def nest(upstream, method, path, json=None, **kw):
+        batches.append(len(json["connections"]))
+        if len(batches) <= 2:
+            return False, {"error": "Nest indisponível"}
+        return True, {"results": [{"ok": True, "id": i} for i in range(len(json["connections"]))]}
+
+    monkeypatch.setattr(main, "_nest_request", nest)
+    _dispatch(main)
+    _dispatch(main)
+    assert main._outbox_breaker["state"] == "open"
+    main._outbox_breaker["openUntil"] = 0.0
+    _dispatch(main)
+    assert batches == [3, 3, 1]
+    assert main._outbox_breaker["state"] == "closed"
+    assert _rows(main) == [("pending", 2), ("pending", 2)]
@@ -0,0 +1,61 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+def _login(name, mac, ip="10.0.0.1", minutes_ago=1, ssid="WIFI"):
+    created = (datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)).isoformat()
+    return (name, f"{name}@x.com", None, ssid, mac, "ap", ip, "ua", created, "Android", 0)
+
+
+def _sessions(main):
+    conn = sqlite3.connect(main.DB_PATH)
+    try:
+        return sorted(conn.execute("SELECT client_mac, login_count, name FROM client_sessions").fetchall())
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("AA:BB:CC:DD:EE:FF", "aa:bb:cc:dd:ee:ff"),
+        ("aa-bb-cc-dd-ee-ff", "aa:bb:cc:dd:ee:ff"),
+        (" aabb.ccdd.eeff ", "aa:bb:cc:dd:ee:ff"),
+        ("AABBCCDDEEFF", "aa:bb:cc:dd:ee:ff"),
+        ("AA:BB", "aa:bb"),
+        ("", ""),
+        (None, ""),
+    ],
+)
+def test_mac_normalizer_matches_sql(app_main, raw, expected):
+    main = app_main
+    assert main._normalize_mac(raw) == expected
+    conn = sqlite3.connect(":memory:")
+    try:
+        got = conn.execute(f"SELECT {main._mac_sql('m')} FROM (SELECT ? AS m)", (raw,)).fetchone()[0]
+    finally:
+        conn.close()
+    assert (got or "") == expected
+
+
+def test_mac_formats_share_one_session(app_main):
+    main = app_main
+    rows = [_login("ana", "AA-BB-CC-DD-EE-01", minutes_ago=3), _login("ana", "aa:bb:cc:dd:ee:01", minutes_ago=2)]
+    main._db_insert_logins(rows)
+    assert _sessions(main) == [("aa:bb:cc:dd:ee:01", 2, "ana")]
+
+
+def test_guests_without_mac_behind_same_ip_stay_separate(app_main):
+    main = app_main
+    main._db_insert_logins([_login("ana", None, minutes_ago=3), _login("bia", None, minutes_ago=2)])
+    sessions = _sessions(main)
+    assert [name for _k, _n, name in sessions] == ["ana", "bia"]
+    assert all(key.startswith("login:") for key, _n, _name in sessions)
+    # O rebuild chega às mesmas sessões que a gravação incremental
+    conn = sqlite3.connect(main.DB_PATH)
+    with conn:
+        main._db_rebuild_sessions(conn)
+    conn.close()
+    assert _sessions(main) == sessions
@@ -6,13 +6,21 @@ import type { ConnectionRecord } from './connections.service.js';
 export class ConnectionsController {
   constructor(private svc: ConnectionsService) {}
 
-  @Post('/connections')
-  async create(@Body() body: ConnectionRecord) {
-    if (!body.acceptTerms) {
-      return { error: 'Terms must be accepted' };
+  private validate(body?: ConnectionRecord): string | null {
+    if (!body?.acceptTerms) {
+      return 'Terms must be accepted';
     }
     if (!body.email && !body.phone) {
-      return { error: 'Provide email or phone' };
+      return 'Provide email or phone';
+    }
+    return null;
+  }
+
+  @Post('/connections')
+  async create(@Body() body: ConnectionRecord) {
+    const invalid = this.validate(body);
+    if (invalid) {
+      return { error: invalid };
     }
     try {
       const saved = await this.svc.create(body);
@@ -22,6 +30,25 @@ export class ConnectionsController {
     }
   }
 
+  // Lote enviado pelo outbox do FastAPI: resultado por item (mesma ordem);
+  // falha do banco vira erro do lote inteiro (o FastAPI reenvia depois).
+  @Post('/connections/batch')
+  async createBatch(@Body() body: { connections?: ConnectionRecord[] }) {
+    const items = Array.isArray(body?.connections) ? body.connections : [];
+    const errors = items.map((item) => this.validate(item));
+    const valid = items.filter((_, i) => !errors[i]);
+    try {
+      const saved = valid.length ? await this.svc.createMany(valid) : [];
+      let next = 0;
+      const results = errors.map((error) =>
+        error ? { ok: false, error } : { ok: true, id: saved[next++]?.id }
+      );
+      return { results };
+    } catch (err: any) {
+      return { error: err?.message || 'Failed to save connections' };
+    }
+  }
+
   @Get('/connections')
   async list() {
     try {
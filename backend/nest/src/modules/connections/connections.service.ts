@@ -15,6 +15,7 @@ export type ConnectionRecord = {
 export class ConnectionsService {
   private pool: Pool;
   private dbAvailable = true;
+  private schemaReady = false;
   private memory: ConnectionRecord[] = [];
   private nextId = 1;
 
@@ -27,6 +28,7 @@ export class ConnectionsService {
   }
 
   private async ensureSchema() {
+    if (this.schemaReady) return;
     try {
       await this.pool.query(`
         CREATE TABLE IF NOT EXISTS connections (
@@ -39,7 +41,20 @@ export class ConnectionsService {
           created_at TIMESTAMP DEFAULT NOW()
         );
       `);
+      // Token único: o outbox do FastAPI reenvia lotes (entrega at-least-once).
+      // Duplicatas de reenvios anteriores são removidas antes de criar o índice.
+      await this.pool.query(`
+        DO $$
+        BEGIN
+          IF to_regclass('connections_token_key') IS NULL THEN
+            DELETE FROM connections a USING connections b
+            WHERE a.token = b.token AND a.id > b.id;
+            CREATE UNIQUE INDEX connections_token_key ON connections (token);
+          END IF;
+        END $$;
+      `);
       this.dbAvailable = true;
+      this.schemaReady = true;
     } catch (err) {
       console.error('[ConnectionsService] PostgreSQL unavailable:', (err as any)?.message || err);
       this.dbAvailable = false;
@@ -49,6 +64,8 @@ export class ConnectionsService {
   async create(rec: ConnectionRecord): Promise<ConnectionRecord> {
     await this.ensureSchema();
     if (!this.dbAvailable) {
+      const existing = rec.token ? this.memory.find((m) => m.token === rec.token) : undefined;
+      if (existing) return existing;
       const saved: ConnectionRecord = {
         id: this.nextId++,
         name: rec.name || null || undefined,
@@ -61,15 +78,84 @@ export class ConnectionsService {
       this.memory.unshift(saved);
       return saved;
     }
+    // Reenvio do mesmo token devolve o registro já gravado
     const res = await this.pool.query(
-      `INSERT INTO connections (name, email, phone, accept_terms, token)
-       VALUES ($1, $2, $3, $4, $5)
-       RETURNING id, name, email, phone, accept_terms as "acceptTerms", token, created_at as "createdAt"`,
+      `WITH ins AS (
+         INSERT INTO connections (name, email, phone, accept_terms, token)
+         VALUES ($1, $2, $3, $4, $5)
+         ON CONFLICT (token) DO NOTHING
+         RETURNING id, name, email, phone, accept_terms as "acceptTerms", token, created_at as "createdAt"
+       )
+       SELECT * FROM ins
+       UNION ALL
+       SELECT id, name, email, phone, accept_terms, token, created_at FROM connections
+       WHERE token = $5 AND NOT EXISTS (SELECT 1 FROM ins)`,
       [rec.name || null, rec.email || null, rec.phone || null, !!rec.acceptTerms, rec.token || null]
     );
     return res.rows[0];
   }
 
+  // Inserção em lote (outbox do FastAPI): um único INSERT para todos os registros.
+  // Idempotente por token (lotes reenviados não duplicam); resultado na ordem de `recs`,
+  // casado por token e não pela ordem do RETURNING.
+  async createMany(recs: ConnectionRecord[]): Promise<ConnectionRecord[]> {
+    await this.ensureSchema();
+    if (!this.dbAvailable) {
+      const saved: ConnectionRecord[] = [];
+      for (const rec of recs) {
+        const existing = rec.token ? this.memory.find((m) => m.token === rec.token) : undefined;
+        if (existing) {
+          saved.push(existing);
+          continue;
+        }
+        const row: ConnectionRecord = {
+          id: this.nextId++,
+          name: rec.name || undefined,
+          email: rec.email || undefined,
+          phone: rec.phone || undefined,
+          acceptTerms: !!rec.acceptTerms,
+          token: rec.token || undefined,
+          createdAt: rec.createdAt || new Date().toISOString(),
+        };
+        this.memory.unshift(row);
+        saved.push(row);
+      }
+      return saved;
+    }
+    const withToken = recs.filter((r) => r.token);
+    const byToken = new Map<string, ConnectionRecord>();
+    if (withToken.length) {
+      const res = await this.pool.query(
+        `WITH ins AS (
+           INSERT INTO connections (name, email, phone, accept_terms, token, created_at)
+           SELECT n, e, p, a, t, COALESCE(c, NOW())
+           FROM unnest($1::text[], $2::text[], $3::text[], $4::boolean[], $5::text[], $6::timestamptz[]) AS u(n, e, p, a, t, c)
+           ON CONFLICT (token) DO NOTHING
+           RETURNING id, name, email, phone, accept_terms as "acceptTerms", token, created_at as "createdAt"
+         )
+         SELECT * FROM ins
+         UNION ALL
+         SELECT id, name, email, phone, accept_terms, token, created_at FROM connections
+         WHERE token = ANY($5::text[]) AND token NOT IN (SELECT token FROM ins)`,
+        [
+          withToken.map((r) => r.name || null),
+          withToken.map((r) => r.email || null),
+          withToken.map((r) => r.phone || null),
+          withToken.map((r) => !!r.acceptTerms),
+          withToken.map((r) => r.token),
+          withToken.map((r) => r.createdAt || null),
+        ]
+      );
+      for (const row of res.rows) byToken.set(row.token, row);
+    }
+    // Sem token não há como deduplicar nem casar o resultado: um INSERT por registro
+    const saved: ConnectionRecord[] = [];
+    for (const rec of recs) {
+      saved.push(rec.token ? (byToken.get(rec.token) as ConnectionRecord) : await this.create(rec));
+    }
+    return saved;
+  }
+
   async list(): Promise<ConnectionRecord[]> {
     await this.ensureSchema();
     if (!this.dbAvailable) return this.memory;
@@ -31,7 +31,7 @@ import {
 } from "./ui/dropdown-menu";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "./ui/select";
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogDescription } from "./ui/dialog";
-import { getApiBases } from "@/config/api";
+import { fetchConnectedClients, getApiBases } from "@/config/api";
 
 // Tipo para clientes conectados retornados pelo FastAPI
 type ConnectedClient = {
@@ -163,14 +163,12 @@ export function ConnectedClients() {
     async function tryFastapi(): Promise<boolean> {
       try {
         const fpBase = base ?? fastapiBase;
-        const url = new URL(`${fpBase}/clients/connected`);
-        if (desiredSsid) url.searchParams.set("ssid", desiredSsid);
-        if (siteToUse) url.searchParams.set("siteId", siteToUse);
-        if (ctrl) url.searchParams.set("controllerId", String(ctrl));
-        const res = await fetch(url.toString(), { cache: "no-store" });
-        const data = await res.json().catch(() => ({}));
-        const list: ConnectedClient[] = Array.isArray(data?.clients) ? data.clients : [];
-        if (!res.ok || data?.error) {
+        const { ok, clients: list } = await fetchConnectedClients<ConnectedClient>(fpBase, {
+          ssid: desiredSsid,
+          siteId: siteToUse,
+          controllerId: ctrl ? String(ctrl) : undefined,
+        });
+        if (!ok) {
           return false;
         }
         setRealClients(list);
@@ -203,7 +201,7 @@ export function ConnectedClients() {
           ssid: c?.ssid || desiredSsid || null,
           device: c?.device || c?.hostname || c?.name || null,
           ip: c?.ip || c?.ipAddress || null,
-          mac: c?.mac || c?.macAddress || null,
+          mac: String(c?.mac || c?.macAddress || "").trim().toLowerCase() || null,
           apMac: c?.apMac || null,
           connectedSeconds: c?.uptimeSeconds || undefined,
           bandwidthBytes: typeof c?.bytes === 'number' ? c.bytes : undefined,
@@ -215,14 +213,12 @@ export function ConnectedClients() {
         // Tentar enriquecer com dados do formulário (FastAPI) caso disponível
         try {
           const fp = await getApiBases();
-          const enrichUrl = new URL(`${fp.FASTAPI_BASE}/clients/connected`);
-          if (desiredSsid) enrichUrl.searchParams.set('ssid', desiredSsid);
-          if (siteToUse) enrichUrl.searchParams.set('siteId', siteToUse);
-          if (ctrl) enrichUrl.searchParams.set('controllerId', String(ctrl));
-          const enrRes = await fetch(enrichUrl.toString(), { cache: 'no-store' });
-          const enrData = await enrRes.json().catch(() => ({}));
-          const enrList: ConnectedClient[] = Array.isArray(enrData?.clients) ? enrData.clients : [];
-          if (enrRes.ok && enrList.length) {
+          const { ok: enrOk, clients: enrList } = await fetchConnectedClients<ConnectedClient>(fp.FASTAPI_BASE, {
+            ssid: desiredSsid,
+            siteId: siteToUse,
+            controllerId: ctrl ? String(ctrl) : undefined,
+          });
+          if (enrOk && enrList.length) {
             const byMac = new Map<string, ConnectedClient>();
             enrList.forEach((it) => { const m = (it.mac || '').toLowerCase(); if (m) byMac.set(m, it); });
             mapped = mapped.map((c) => {
@@ -29,6 +29,8 @@ export function DashboardOverview() {
   // Dados reais
   type Client = { email?: string|null; phone?: string|null; name?: string|null; bandwidthBytes?: number; connectedSeconds?: number };
   const [clients, setClients] = useState<Client[]>([]);
+  // Contadores de /clients/stats (dispositivos, mesma contagem de /clients/connected)
+  const [clientStats, setClientStats] = useState<{ total: number; online: number; idle: number } | null>(null);
   const [recent, setRecent] = useState<Array<{ name?: string|null; email?: string|null; phone?: string|null; createdAt?: string }>>([]);
   const [ctrls, setCtrls] = useState<Array<{ id: number; name?: string }>>([]);
   const [ctrlMetrics, setCtrlMetrics] = useState<Record<number, { clients: number; load: number; status: "online"|"warning"|"offline" }>>({});
@@ -52,11 +54,19 @@ export function DashboardOverview() {
   async function loadRealData() {
     try {
       const { FASTAPI_BASE, NEST_BASE } = await getApiBases();
-      // clientes conectados (sem filtros -> todos)
+      // totais de clientes: agregados do backend, sem paginar a lista inteira
       try {
-        const r = await fetch(`${FASTAPI_BASE}/clients/connected`, { cache: "no-store" });
+        const r = await fetch(`${FASTAPI_BASE}/clients/stats`, { cache: "no-cache" });
         const j = await r.json().catch(() => ({}));
-        setClients(Array.isArray(j?.clients) ? j.clients : []);
+        if (r.ok && typeof j?.total === "number") setClientStats({ total: j.total, online: j.online || 0, idle: j.idle || 0 });
+      } catch {}
+      // clientes mais recentes (primeira página): status e duração das conexões recentes
+      try {
+        const url = new URL(`${FASTAPI_BASE}/clients/connected`);
+        url.searchParams.set("fields", "name,email,phone,bandwidthBytes,connectedSeconds");
+        const r = await fetch(url.toString(), { cache: "no-cache" });
+        const j = await r.json().catch(() => ({}));
+        if (r.ok && Array.isArray(j?.clients)) setClients(j.clients);
       } catch {}
       // conexões recentes
       try {
@@ -198,17 +208,18 @@ export function DashboardOverview() {
     if (!r.createdAt) return false; const d = new Date(r.createdAt); const now = new Date();
     return d.getFullYear()===now.getFullYear() && d.getMonth()===now.getMonth() && d.getDate()===now.getDate();
   }), [recent]);
+  const connectedCount = clientStats ? clientStats.total : clients.length;
   const conversionPct = useMemo(() => {
     const denom = Math.max(1, connectionsToday.length);
-    return `${Math.round((clients.length/denom)*100)}%`;
-  }, [clients.length, connectionsToday.length]);
+    return `${Math.round((connectedCount/denom)*100)}%`;
+  }, [connectedCount, connectionsToday.length]);
 
   const stats = useMemo(() => ([
-    { title: "Clientes Conectados", value: String(clients.length), change: "—", trend: "up", icon: Users, color: "text-blue-600", bgColor: "bg-blue-50" },
+    { title: "Clientes Conectados", value: String(connectedCount), change: "—", trend: "up", icon: Users, color: "text-blue-600", bgColor: "bg-blue-50" },
     { title: "Controladoras Ativas", value: String(ctrls.length), change: "—", trend: "up", icon: Wifi, color: "text-green-600", bgColor: "bg-green-50" },
     { title: "Taxa de Conversão", value: conversionPct, change: "—", trend: "up", icon: TrendingUp, color: "text-purple-600", bgColor: "bg-purple-50" },
     { title: "Banda Utilizada", value: formatBytes(totalBandwidth), change: "—", trend: "up", icon: Activity, color: "text-orange-600", bgColor: "bg-orange-50" },
-  ]), [clients.length, ctrls.length, totalBandwidth, conversionPct]);
+  ]), [connectedCount, ctrls.length, totalBandwidth, conversionPct]);
 
   return (
     <div className="space-y-6">
@@ -25,4 +25,29 @@ export async function getApiBases(): Promise<ApiBases> {
   cachedBases = { FASTAPI_BASE: fast, NEST_BASE: nest };
   cachedAt = Date.now();
   return cachedBases;
-}
\ No newline at end of file
+}
+// /clients/connected é paginado (limit + nextCursor): segue as páginas até o fim.
+// "no-cache" (e não "no-store"): o navegador revalida com If-None-Match e a página
+// sem mudança volta como 304, servida do cache HTTP.
+const CLIENTS_MAX_PAGES = 100;
+
+export async function fetchConnectedClients<T = any>(
+  fastapiBase: string,
+  params: Record<string, string | undefined>,
+  init: RequestInit = { cache: "no-cache" },
+): Promise<{ ok: boolean; clients: T[] }> {
+  const clients: T[] = [];
+  let cursor: string | null = null;
+  for (let i = 0; i < CLIENTS_MAX_PAGES; i++) {
+    const url = new URL(`${fastapiBase}/clients/connected`);
+    Object.entries(params).forEach(([k, v]) => { if (v) url.searchParams.set(k, v); });
+    if (cursor) url.searchParams.set("cursor", cursor);
+    const res = await fetch(url.toString(), init);
+    const data = await res.json().catch(() => ({}));
+    if (!res.ok || data?.error) return { ok: false, clients };
+    if (Array.isArray(data?.clients)) clients.push(...data.clients);
+    cursor = typeof data?.nextCursor === "string" ? data.nextCursor : null;
+    if (!cursor) break;
+  }
+  return { ok: true, clients };
+}